@@ -9,14 +9,84 @@
 import pandas as pd
 import json
 import os
+
+try:
+    import orjson  # C 구현 직렬화기 (없으면 표준 json 사용)
+except ImportError:
+    orjson = None
+
+try:
+    from python_calamine import CalamineWorkbook  # Rust 기반 엑셀 파서 (없으면 openpyxl 사용)
+except ImportError:
+    CalamineWorkbook = None
 import sys
 import unicodedata
 import re
 from pathlib import Path
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
 import webbrowser
 
+def _dumps(obj):
+    """HTML 임베드용 압축 JSON 직렬화 (orjson이 있으면 SIMD 가속 경로 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+def _import_tk():
+    """GUI 경로에서만 tkinter를 로드 (CLI 실행 시 Tcl/X11 초기화 비용 회피)"""
+    global tk, filedialog, messagebox, ttk
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+
+# '그룹명택N' 형식 파싱용 정규식 (모듈 로드 시 1회 컴파일)
+_GROUP_LIMIT_RE = re.compile(r'^(?P<name>.*?)택(?P<limit>\d+)')
+
+# 출력 파일명 정리용 정규식
+_FNAME_UNSAFE_RE = re.compile(r'[\\/*?:"<>|\'\"]')
+_FNAME_WS_RE = re.compile(r'\s+')
+
+# 표준 컬럼명 ↔ 기본 한글 컬럼명 (엑셀 읽기 필터와 컬럼 매핑에서 공용)
+_STANDARD_TO_KOREAN_MAP = {
+    'year': '입학년도', 'semester': '학기', 'type': '유형',
+    'name': '과목명', 'credits': '학점', 'required': '지정여부',
+    'classes': '개설반수', 'subject': '담당과목', 'period': '수업시기',
+    'group': '교과(군)', 'selection_count': '그룹 내 선택수'
+}
+
+# 표준명 → NFC 정규화된 한글 컬럼명 (상수이므로 모듈 로드 시 1회만 정규화)
+_STANDARD_NFC_MAP = {
+    std: unicodedata.normalize('NFC', kor.strip())
+    for std, kor in _STANDARD_TO_KOREAN_MAP.items()
+}
+
+_KNOWN_COLUMN_NAMES = (
+    {unicodedata.normalize('NFC', kor) for kor in _STANDARD_TO_KOREAN_MAP.values()}
+    | set(_STANDARD_TO_KOREAN_MAP)
+)
+
+def _is_known_column(col_name):
+    """read_excel usecols 필터: 매핑 가능한 컬럼만 읽는다"""
+    return unicodedata.normalize('NFC', str(col_name).strip()) in _KNOWN_COLUMN_NAMES
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_WS_RUN_RE = re.compile(r'\s+')
+_INTER_TAG_WS_RE = re.compile(r'>\s+<')
+
+def _minify_template(html):
+    """정적 템플릿 1회 축소: CSS 주석/공백 제거, 태그 사이 공백 축소.
+
+    인라인 <script> 블록은 // 주석과 템플릿 리터럴이 있어 손대지 않는다.
+    """
+    script_start = html.find('<script>')
+    head, script_part = html[:script_start], html[script_start:]
+
+    def minify_css(match):
+        css = _CSS_COMMENT_RE.sub('', match.group(1))
+        return '<style>' + _WS_RUN_RE.sub(' ', css).strip() + '</style>'
+
+    head = re.sub(r'<style>(.*?)</style>', minify_css, head, flags=re.S)
+    head = _INTER_TAG_WS_RE.sub('><', head)
+    return head + script_part
+
 # macOS 한글 경로 문제 해결
 if sys.platform == 'darwin':  # macOS
     try:
@@ -30,12 +100,20 @@ class CourseSimulatorGenerator:
         self.df = None
         self.school_name = ""
         self.group_limits = {}  # 그룹별 선택 제한 정보 (키: "학기_선택그룹명")
-        self.html_template = self._get_html_template()
+        self.html_template = _MINIFIED_HTML_TEMPLATE  # 모듈 로드 시 준비된 공유 템플릿
         self.available_columns_map = {} # 엑셀의 실제 컬럼명 매핑
-
-    def select_excel_file(self):
-        """엑셀 파일 선택 대화상자"""
+        self.course_list = None  # process_data에서 1회 생성 후 재사용
+        self.semesters = None
+        self._cols_nfc = None  # NFC 정규화 컬럼명 → 실제 컬럼명 (로드 시 1회 계산)
+
+    def select_excel_file(self, file_path=None):
+        """엑셀 파일 선택 대화상자 (경로를 받으면 대화상자 없이 그대로 사용)"""
+        if file_path:
+            file_path = os.path.normpath(file_path)
+            print(f"📁 선택된 파일: {file_path}")
+            return file_path
         try:
+            _import_tk()
             root = tk.Tk()
             root.withdraw()  # 메인 창 숨기기
             initial_dir = os.path.expanduser("~/Desktop")
@@ -59,14 +137,45 @@ class CourseSimulatorGenerator:
     def load_excel_data(self, file_path):
         """엑셀 파일 로드 및 데이터 검증"""
         try:
-            if file_path.endswith('.xlsx'):
-                self.df = pd.read_excel(file_path, engine='openpyxl', dtype=str) 
+            self.df = None
+
+            if CalamineWorkbook is not None:
+                try:
+                    self.df = self._read_with_calamine(file_path)
+                except Exception:
+                    self.df = None  # 서식/형식 문제 시 openpyxl 경로로 폴백
+
+            if self.df is not None:
+                pass
+            elif file_path.endswith('.xlsx'):
+                try:
+                    # read_only/data_only 스트리밍 모드 - 대형 워크북 로드가 크게 빨라짐.
+                    # 인식 가능한 컬럼만 읽어 메모리와 파싱량을 줄인다.
+                    self.df = pd.read_excel(
+                        file_path, engine='openpyxl', dtype=str,
+                        engine_kwargs={'read_only': True, 'data_only': True},
+                        usecols=_is_known_column)
+                except Exception:
+                    # 구버전 pandas 또는 비정형 워크북이면 기본 경로로 재시도
+                    self.df = pd.read_excel(file_path, engine='openpyxl', dtype=str)
             else:
-                self.df = pd.read_excel(file_path, dtype=str) 
+                self.df = pd.read_excel(file_path, dtype=str)
             
+            # dtype=str로 읽었으므로 셀 단위 type() 검사 없이 dtype만 보고 strip
             for col in self.df.columns:
-                if self.df[col].apply(type).eq(str).all(): 
-                     self.df[col] = self.df[col].str.strip()
+                if pd.api.types.is_string_dtype(self.df[col]) or self.df[col].dtype == object:
+                    self.df[col] = self.df[col].str.strip()
+
+            try:
+                # Arrow 백엔드 문자열 dtype: object 박싱이 사라져 이후
+                # 컬럼 단위 문자열 연산과 to_numpy 추출이 가벼워진다.
+                self.df = self.df.convert_dtypes(dtype_backend='pyarrow')
+            except Exception:
+                pass  # pyarrow 미설치 등으로 실패 시 object dtype 그대로 사용
+
+            # 컬럼명 정리와 NFC 정규화 매핑은 로드 시점에 1회만 계산
+            self.df.columns = [str(col).strip() for col in self.df.columns]
+            self._cols_nfc = {unicodedata.normalize('NFC', col): col for col in self.df.columns}
 
             print(f"✅ 엑셀 파일 로드 완료 (공백 제거 적용): {len(self.df)}개 행")
             print(f"📋 원본 컬럼: {list(self.df.columns)}")
@@ -85,43 +194,39 @@ class CourseSimulatorGenerator:
             print(f"❌ 엑셀 파일 로드 실패: {e}")
             return False
 
+    def _read_with_calamine(self, file_path):
+        """Rust 기반 calamine 엔진으로 읽기 - openpyxl의 DOM 파싱보다 수 배 빠름"""
+        # 정수 셀은 엔진이 int로 돌려주므로 dtype=str이어도 4.0 → '4'로 유지된다
+        return pd.read_excel(file_path, engine='calamine', dtype=str,
+                             usecols=_is_known_column)
+
     def parse_group_limits(self, selection_info):
-        """그룹 내 선택수 정보 파싱"""
+        """그룹 내 선택수 정보 파싱 (행 단위 폴백 - 대량 처리는 벡터 연산 사용)"""
         if pd.isna(selection_info) or not str(selection_info).strip():
             return None, None
-        selection_str = str(selection_info).strip() 
-        pattern = r'택(\d+)'
-        match = re.search(pattern, selection_str)
+        match = _GROUP_LIMIT_RE.match(str(selection_info).strip())
         if match:
-            limit = int(match.group(1))
-            group_name = selection_str.split('택')[0].strip()
-            if not group_name:
-                group_name = "선택그룹" 
-            return group_name, limit
+            group_name = match.group('name').strip() or "선택그룹"
+            return group_name, int(match.group('limit'))
         return None, None
 
     def _map_columns(self):
         """표준 컬럼명과 실제 엑셀 컬럼명 매핑"""
-        standard_to_korean_map = {
-            'year': '입학년도', 'semester': '학기', 'type': '유형',
-            'name': '과목명', 'credits': '학점', 'required': '지정여부',
-            'classes': '개설반수', 'subject': '담당과목', 'period': '수업시기',
-            'group': '교과(군)', 'selection_count': '그룹 내 선택수'
-        }
         self.available_columns_map = {}
         if self.df is None:
             return
 
-        self.df.columns = [col.strip() for col in self.df.columns]
-        df_columns_normalized = {unicodedata.normalize('NFC', col): col for col in self.df.columns}
-
-        for std_name, kor_default_name in standard_to_korean_map.items():
-            kor_default_name_normalized = unicodedata.normalize('NFC', kor_default_name.strip())
-            if kor_default_name_normalized in df_columns_normalized:
-                self.available_columns_map[std_name] = df_columns_normalized[kor_default_name_normalized]
-            else: 
-                 if std_name in df_columns_normalized: 
-                     self.available_columns_map[std_name] = df_columns_normalized[std_name]
+        df_columns_normalized = self._cols_nfc
+        if df_columns_normalized is None:  # load_excel_data를 거치지 않은 DataFrame 주입 경로
+            self.df.columns = [str(col).strip() for col in self.df.columns]
+            df_columns_normalized = {unicodedata.normalize('NFC', col): col for col in self.df.columns}
+
+        # 상수 쪽 NFC 정규화는 _STANDARD_NFC_MAP에서 이미 끝나 있다
+        for std_name, kor_name_nfc in _STANDARD_NFC_MAP.items():
+            if kor_name_nfc in df_columns_normalized:
+                self.available_columns_map[std_name] = df_columns_normalized[kor_name_nfc]
+            elif std_name in df_columns_normalized:
+                self.available_columns_map[std_name] = df_columns_normalized[std_name]
         print(f"🔍 인식된 컬럼 매핑: {self.available_columns_map}")
 
     def get_col_name(self, standard_name):
@@ -144,35 +249,50 @@ class CourseSimulatorGenerator:
             
             self.df = self.df.dropna(subset=[name_col])
             self.df[credits_col] = self.df[credits_col].astype(str).str.strip()
-            self.df[credits_col] = pd.to_numeric(self.df[credits_col], errors='coerce').fillna(0)
+            # int64로 한 번에 변환해 두면 이후 경로에 행 단위 int() 캐스트가 필요 없다
+            self.df[credits_col] = (pd.to_numeric(self.df[credits_col], errors='coerce')
+                                    .fillna(0).astype('int64'))
 
             self.group_limits = {}
             selection_count_col = self.get_col_name('selection_count')
             semester_col = self.get_col_name('semester')
 
             if selection_count_col:
-                for _, row in self.df.iterrows():
-                    selection_info = str(row.get(selection_count_col, '')).strip()
-                    parsed_group_name, limit = self.parse_group_limits(selection_info)
-
-                    if parsed_group_name and limit:
-                        semester = str(row.get(semester_col, '')).strip() 
-                        if not semester: continue 
-
-                        key = f"{semester}_{parsed_group_name}" # Key is based on semester and selection group name
-
-                        if key not in self.group_limits:
-                            self.group_limits[key] = {
-                                'semester': semester,
-                                'group_name': parsed_group_name, # This is the "선택그룹명"
-                                'limit': limit
-                            }
+                # 행 단위 iterrows 대신 컬럼 단위 벡터 연산으로 한 번에 파싱
+                selection_series = self.df[selection_count_col].fillna('').astype(str).str.strip()
+                # 그룹명과 제한 수를 extract 1회로 함께 추출 (parse_group_limits와 동일 패턴)
+                extracted = selection_series.str.extract(_GROUP_LIMIT_RE)
+                limits = pd.to_numeric(extracted['limit'], errors='coerce')
+                group_names = extracted['name'].fillna('').str.strip()
+                group_names = group_names.where(group_names != '', '선택그룹')
+                semesters_series = self.df[semester_col].fillna('').astype(str).str.strip()
+
+                # 파싱 결과를 컬럼으로 보관해 generate_course_data의 재파싱을 없앤다
+                self.df['_selection_group'] = group_names.where(limits.notna(), None)
+                self.df['_selection_limit'] = limits
+
+                valid = limits.notna() & (semesters_series != '')
+                for semester, parsed_group_name, limit in zip(
+                        semesters_series[valid], group_names[valid], limits[valid]):
+                    key = f"{semester}_{parsed_group_name}" # Key is based on semester and selection group name
+
+                    if key not in self.group_limits:
+                        self.group_limits[key] = {
+                            'semester': semester,
+                            'group_name': parsed_group_name, # This is the "선택그룹명"
+                            'limit': int(limit)
+                        }
                 print(f"🎯 그룹별 선택 제한 정보: {len(self.group_limits)}개")
                 for key, info in self.group_limits.items():
                     print(f"   - {info['semester']} / '{info['group_name']}' 그룹: 최대 {info['limit']}개 선택 (Key: {key})")
             else:
                 print("⚠️ '그룹 내 선택수' 컬럼이 없어 그룹 선택 제한 기능을 사용하지 않습니다.")
 
+            # 과목 목록/학기 목록을 여기서 한 번만 생성해 두고 이후에는 재사용
+            self.course_list = None
+            self.semesters = None
+            self.generate_course_data()
+
             print(f"✅ 데이터 처리 완료: {len(self.df)}개 과목")
             return True
         except Exception as e:
@@ -180,8 +300,9 @@ class CourseSimulatorGenerator:
             return False
 
     def generate_course_data(self):
+        if self.course_list is not None:
+            return self.course_list, self.semesters
         try:
-            course_list = []
             if self.df is None or not self.available_columns_map:
                 print("❌ 데이터프레임 또는 컬럼 매핑 정보가 없습니다.")
                 return [], []
@@ -195,34 +316,72 @@ class CourseSimulatorGenerator:
             group_col = self.get_col_name('group') # 교과(군)
             selection_count_col = self.get_col_name('selection_count')
 
-            for _, row in self.df.iterrows():
-                parsed_group_name, selection_limit = None, None
-                if selection_count_col:
-                    selection_info = str(row.get(selection_count_col, '')).strip()
-                    parsed_group_name, selection_limit = self.parse_group_limits(selection_info)
-
-                course_name_val = str(row.get(name_col, '')).strip()
-                semester_val = str(row.get(semester_col, '')).strip()
-                
-                if not course_name_val or not semester_val: 
-                    continue
-
-                course = {
-                    'semester': semester_val,
-                    'type': str(row.get(type_col, '')).strip(),
-                    'name': course_name_val,
-                    'credits': int(row.get(credits_col, 0)) if pd.notna(row.get(credits_col, 0)) else 0,
-                    'required': str(row.get(required_col, '')).strip(),
-                    'subject': str(row.get(subject_col, '')).strip(), 
-                    'group': str(row.get(group_col, '')).strip(), # 교과(군) for display
-                    'selection_group': parsed_group_name if parsed_group_name else None, # 선택그룹명
-                    'selection_limit': selection_limit if selection_limit else None     
-                }
-                course_list.append(course)
+            def _str_column(col_name):
+                """컬럼을 공백 제거된 문자열 배열로 추출 (없으면 빈 문자열 배열)"""
+                if col_name is None:
+                    return [''] * len(self.df)
+                series = self.df[col_name]
+                # dtype=str 로드 경로면 이미 문자열이므로 astype(str) 재변환을 생략
+                if not (series.dtype == object or pd.api.types.is_string_dtype(series)):
+                    series = series.astype(str)
+                return series.fillna('').str.strip().to_numpy()
+
+            names = _str_column(name_col)
+            semesters_arr = _str_column(semester_col)
+            types = _str_column(type_col)
+            requireds = _str_column(required_col)
+            subjects = _str_column(subject_col)
+            groups = _str_column(group_col)
+            credits_series = self.df[credits_col]
+            if not pd.api.types.is_integer_dtype(credits_series):
+                # process_data를 거치지 않고 호출된 경우에만 재변환
+                credits_series = pd.to_numeric(credits_series, errors='coerce').fillna(0)
+            credits = credits_series.to_numpy()
+
+            if '_selection_group' in self.df.columns:
+                # process_data가 이미 파싱해 둔 컬럼 재사용 (정규식 패스 생략)
+                selection_groups = self.df['_selection_group'].to_numpy()
+                selection_limits = pd.to_numeric(self.df['_selection_limit'], errors='coerce').to_numpy()
+            elif selection_count_col:
+                selection_series = self.df[selection_count_col].fillna('').astype(str).str.strip()
+                # 그룹명과 제한 수를 extract 1회로 함께 추출 (parse_group_limits와 동일 패턴)
+                extracted = selection_series.str.extract(_GROUP_LIMIT_RE)
+                limits = pd.to_numeric(extracted['limit'], errors='coerce')
+                group_names = extracted['name'].fillna('').str.strip()
+                group_names = group_names.where(group_names != '', '선택그룹')
+                selection_groups = group_names.where(limits.notna(), None).to_numpy()
+                selection_limits = limits.to_numpy()
+            else:
+                selection_groups = [None] * len(self.df)
+                selection_limits = [float('nan')] * len(self.df)
+
+            limits_series = pd.Series(selection_limits, dtype='float64')
+            has_limit = limits_series.notna()
+            # where(None)로 NaN을 JSON 직렬화 가능한 None으로 바꾼다
+            sel_group_col = pd.Series(selection_groups, dtype=object).where(has_limit, None)
+            sel_limit_col = (limits_series.fillna(-1).astype('int64')
+                             .astype(object).where(has_limit, None))
+
+            out = pd.DataFrame({
+                'semester': semesters_arr,
+                'type': types,
+                'name': names,
+                'credits': pd.Series(credits).fillna(0).astype('int64'),
+                'required': requireds,
+                'subject': subjects,
+                'group': groups, # 교과(군) for display
+                'selection_group': sel_group_col, # 선택그룹명
+                'selection_limit': sel_limit_col
+            })
+            valid_rows = out['name'].ne('') & out['semester'].ne('')
+            # 행 단위 dict 조립 대신 pandas의 C 경로로 일괄 변환
+            course_list = out[valid_rows].to_dict(orient='records')
 
             print(f"✅ {len(course_list)}개 과목 데이터 생성")
-            semesters = sorted(list(set(course['semester'] for course in course_list if course['semester'])))
+            semesters = out.loc[valid_rows, 'semester'].drop_duplicates().sort_values().tolist()
             print(f"📅 학기 목록: {semesters}")
+            self.course_list = course_list
+            self.semesters = semesters
             return course_list, semesters
         except Exception as e:
             print(f"❌ 과목 데이터 생성 실패: {e}")
@@ -235,24 +394,24 @@ class CourseSimulatorGenerator:
                 print("❌ 생성할 과목 데이터가 없습니다 (generate_course_data 실패).")
                 return False
 
-            js_course_data = json.dumps(course_data, ensure_ascii=False, indent=2)
-            js_group_limits = json.dumps(self.group_limits, ensure_ascii=False, indent=2)
+            # 브라우저만 읽는 데이터이므로 들여쓰기 없이 압축 직렬화
+            js_course_data = _dumps(course_data)
+            js_group_limits = _dumps(self.group_limits)
 
             display_school_name = self.school_name if self.school_name else "고등학교"
 
-            html_content = self.html_template.format(
-                school_name=display_school_name,
-                course_data=js_course_data,
-                group_limits=js_group_limits
-            )
-
+            substitutions = {
+                '__SCHOOL_NAME__': display_school_name,
+                '__COURSE_DATA__': js_course_data,
+                '__GROUP_LIMITS__': js_group_limits,
+            }
             final_file_path_to_use = ""
             if output_path: 
                 final_file_path_to_use = output_path
             else: 
                 current_school_name_for_file = self.school_name
-                safe_school_filename_part = re.sub(r'[\\/*?:"<>|\'\"]', "", current_school_name_for_file) 
-                safe_school_filename_part = re.sub(r'\s+', "_", safe_school_filename_part) 
+                safe_school_filename_part = _FNAME_UNSAFE_RE.sub("", current_school_name_for_file)
+                safe_school_filename_part = _FNAME_WS_RE.sub("_", safe_school_filename_part) 
                 safe_school_filename_part = safe_school_filename_part.strip('_') 
                 
                 if not safe_school_filename_part: 
@@ -262,16 +421,15 @@ class CourseSimulatorGenerator:
             output_abs_path = os.path.abspath(final_file_path_to_use)
             os.makedirs(os.path.dirname(output_abs_path), exist_ok=True)
 
-            with open(output_abs_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # 미리 쪼개 둔 템플릿 조각을 큰 버퍼로 순서대로 기록
+            # (템플릿 + JSON 전체를 합친 중간 문자열을 만들지 않음)
+            with open(output_abs_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                for part in _TEMPLATE_PARTS:
+                    f.write(substitutions.get(part, part))
 
             print(f"✅ HTML 파일 생성 완료: {output_abs_path}")
             print(f"📊 총 {len(course_data)}개 과목, {len(semesters)}개 학기")
             return output_abs_path
-        except KeyError as ke:
-            # This is where the error '' \n            infoText += ` | 담당'' would be caught if it's a Python format key error
-            print(f"❌ HTML 생성 중 KeyError 발생: 키 '{ke}'를 찾을 수 없습니다. HTML 템플릿의 {{...}} 사용을 확인하거나, 데이터 또는 컬럼명을 확인해주세요.")
-            return False
         except OSError as oe:
             print(f"❌ HTML 파일 저장 중 OSError 발생: {oe}. 파일 경로 또는 권한을 확인해주세요.")
             return False
@@ -279,39 +437,39 @@ class CourseSimulatorGenerator:
             print(f"❌ HTML 생성 실패 (기타 오류): {e}")
             return False
 
-    def _get_html_template(self):
-        # Ensure this template string is exactly as intended.
-        # Python's .format() uses {key}. JavaScript uses ${expression}.
-        # Literal braces in CSS/JS that Python might misinterpret as placeholders should be escaped: {{ for { and }} for }.
-        return '''<!DOCTYPE html>
+
+# 생성 HTML 템플릿: 모듈 로드 시 1회 정의하고, 정적 부분을 축소해 공유한다.
+# 치환은 generate_html에서 __SCHOOL_NAME__/__COURSE_DATA__/__GROUP_LIMITS__
+# 센티널 토큰에 대한 str.replace로 수행하므로 CSS/JS 중괄호 이스케이프가 필요 없다.
+_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
-    <title>{school_name} 과목 선택 시뮬레이션</title>
+    <title>__SCHOOL_NAME__ 과목 선택 시뮬레이션</title>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.1/html2canvas.min.js"></script>
     <style>
-        * {{ /* CSS uses single braces, Python .format() needs these escaped if they are not for JS template literals */
+        * { /* CSS uses single braces, Python .format() needs these escaped if they are not for JS template literals */
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        html, body {{
+        html, body {
             height: 100%;
             overflow-x: hidden;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 10px;
             font-size: 14px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
@@ -319,49 +477,49 @@ class CourseSimulatorGenerator:
             box-shadow: 0 10px 30px rgba(0,0,0,0.1);
             overflow: hidden;
             min-height: calc(100vh - 20px);
-        }}
+        }
 
-        .header {{
+        .header {
             background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
             color: white;
             padding: 20px 15px;
             text-align: center;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 1.8em;
             margin-bottom: 8px;
             text-shadow: 0 2px 4px rgba(0,0,0,0.3);
             word-break: keep-all;
-        }}
+        }
 
-        .header p {{
+        .header p {
             font-size: 0.9em;
             opacity: 0.9;
-        }}
+        }
 
-        .tabs {{
+        .tabs {
             display: flex;
             background: #f8f9fa;
             border-bottom: 1px solid #dee2e6;
             overflow-x: auto;
             -webkit-overflow-scrolling: touch;
-        }}
+        }
 
-        .tabs::-webkit-scrollbar {{
+        .tabs::-webkit-scrollbar {
             height: 3px;
-        }}
+        }
 
-        .tabs::-webkit-scrollbar-track {{
+        .tabs::-webkit-scrollbar-track {
             background: #f1f1f1;
-        }}
+        }
 
-        .tabs::-webkit-scrollbar-thumb {{
+        .tabs::-webkit-scrollbar-thumb {
             background: #4facfe;
             border-radius: 3px;
-        }}
+        }
 
-        .tab {{
+        .tab {
             padding: 12px 16px;
             cursor: pointer;
             border: none;
@@ -372,52 +530,52 @@ class CourseSimulatorGenerator:
             border-bottom: 3px solid transparent;
             min-width: 100px;
             flex-shrink: 0;
-        }}
+        }
 
-        .tab:hover {{
+        .tab:hover {
             background: #e9ecef;
-        }}
+        }
 
-        .tab.active {{
+        .tab.active {
             background: white;
             border-bottom-color: #4facfe;
             color: #4facfe;
             font-weight: bold;
-        }}
+        }
 
-        .semester-content {{
+        .semester-content {
             display: none;
             padding: 15px;
-        }}
+        }
 
-        .semester-content.active {{
+        .semester-content.active {
             display: block;
-        }}
+        }
 
-        .semester-info {{
+        .semester-info {
             background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
             padding: 15px;
             border-radius: 10px;
             margin-bottom: 20px;
             text-align: center;
-        }}
+        }
 
-        .semester-info h2 {{
+        .semester-info h2 {
             font-size: 1.3em;
             margin-bottom: 8px;
             word-break: keep-all;
-        }}
+        }
 
-        .semester-info p {{
+        .semester-info p {
             font-size: 0.9em;
             color: #666;
-        }}
+        }
 
-        .course-section, .selection-group-wrapper {{ 
+        .course-section, .selection-group-wrapper { 
             margin-bottom: 25px;
-        }}
+        }
         
-        .section-title {{ 
+        .section-title { 
             font-size: 1.1em;
             font-weight: bold;
             color: #333;
@@ -426,68 +584,74 @@ class CourseSimulatorGenerator:
             background: linear-gradient(90deg, #e0e0e0, #f0f0f0); 
             border-left: 4px solid #667eea;
             border-radius: 4px;
-        }}
+        }
 
-        .course-grid {{
+        .course-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
             gap: 12px;
             margin-bottom: 15px;
-        }}
+        }
 
-        .course-card {{
+        .course-card {
             background: #f8f9fa;
             border: 2px solid #e9ecef;
             border-radius: 10px;
             padding: 12px;
             transition: all 0.3s ease;
-            min-height: 120px; 
+            min-height: 120px;
             display: flex;
             flex-direction: column;
             justify-content: space-between;
-        }}
+            /* 화면 밖 카드는 렌더링을 건너뛴다 — 과목 수가 많아도 초기 페인트 비용이 뷰포트 크기에 비례 */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 120px;
+        }
 
-        .course-card:hover {{
+        .course-card:hover {
             transform: translateY(-1px);
             box-shadow: 0 3px 10px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .course-card.required {{
+        .course-card.required {
             background: linear-gradient(135deg, #ffeaef 0%, #fdeff9 100%); 
             border-color: #ffacc5;
-        }}
+        }
 
-        .course-card.selected {{
+        .course-card.selected {
             background: linear-gradient(135deg, #e6f7ff 0%, #f0faff 100%); 
             border-color: #4facfe;
             box-shadow: 0 3px 10px rgba(79, 172, 254, 0.3);
-        }}
+        }
 
-        .course-card.disabled {{
+        .course-card.disabled,
+        .course-grid[data-limit-reached="1"] .course-card:not(.selected) {
             background: #f1f1f1;
             border-color: #ccc;
             opacity: 0.6;
             cursor: not-allowed;
-        }}
+            /* 그룹 정원이 차면 컨테이너 속성 하나로 미선택 카드를 전부 잠근다 */
+            pointer-events: none;
+        }
 
-        .course-header {{
+        .course-header {
             display: flex;
             justify-content: space-between;
             align-items: flex-start;
             margin-bottom: 10px;
             gap: 8px;
-        }}
+        }
 
-        .course-name {{
+        .course-name {
             font-weight: bold;
             font-size: 1em;
             color: #333;
             line-height: 1.3;
             word-break: keep-all; 
             flex: 1;
-        }}
+        }
 
-        .course-credit {{
+        .course-credit {
             background: #667eea;
             color: white;
             padding: 3px 8px;
@@ -496,49 +660,49 @@ class CourseSimulatorGenerator:
             font-weight: bold;
             white-space: nowrap;
             flex-shrink: 0;
-        }}
+        }
 
-        .course-info {{
+        .course-info {
             color: #666;
             font-size: 0.8em;
             margin-bottom: 10px;
             line-height: 1.4; 
-        }}
+        }
 
-        .course-checkbox {{
+        .course-checkbox {
             margin-top: auto; 
             padding-top: 10px;
-        }}
+        }
 
-        .course-checkbox input {{
+        .course-checkbox input {
             margin-right: 8px;
             transform: scale(1.3);
             cursor: pointer;
             vertical-align: middle; 
-        }}
+        }
 
-        .course-checkbox input:disabled {{
+        .course-checkbox input:disabled {
             cursor: not-allowed;
-        }}
+        }
 
-        .course-checkbox label {{
+        .course-checkbox label {
             cursor: pointer;
             font-weight: 500;
             font-size: 0.9em;
             user-select: none;
             -webkit-user-select: none;
             vertical-align: middle; 
-        }}
+        }
 
-        .selection-group-wrapper {{ 
+        .selection-group-wrapper { 
             background: #fff9e6; 
             border: 1px solid #ffecb3;
             border-radius: 8px;
             padding: 15px;
             margin: 15px 0;
-        }}
+        }
 
-        .selection-group-title {{ 
+        .selection-group-title { 
             font-size: 1.05em; 
             font-weight: bold;
             color: #854d0e; 
@@ -548,35 +712,35 @@ class CourseSimulatorGenerator:
             align-items: center;
             padding: 8px 0;
             border-bottom: 2px solid #ffdd80;
-        }}
+        }
 
-        .selection-count {{
+        .selection-count {
             background: rgba(133, 77, 14, 0.1);
             padding: 4px 10px; 
             border-radius: 15px; 
             font-size: 0.85em; 
             color: #854d0e;
             font-weight: 500;
-        }}
+        }
 
-        .selection-group-wrapper.selection-limit-reached {{
+        .selection-group-wrapper.selection-limit-reached {
             background: #ffebee; 
             border-color: #ffcdd2;
-        }}
+        }
 
-        .selection-group-wrapper.selection-limit-reached .selection-group-title {{
+        .selection-group-wrapper.selection-limit-reached .selection-group-title {
             color: #c62828; 
             border-bottom-color: #ef9a9a;
-        }}
+        }
         
-        .required-notice {{ 
+        .required-notice { 
             color: #1b5e20; 
             font-weight: bold;
             margin-top: 10px;
             font-size: 0.85em;
-        }}
+        }
 
-        .summary {{
+        .summary {
             position: sticky;
             top: 10px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -586,34 +750,34 @@ class CourseSimulatorGenerator:
             margin-top: 20px;
             margin-bottom: 20px;
             z-index: 10; 
-        }}
+        }
 
-        .summary h3 {{
+        .summary h3 {
             margin-bottom: 12px;
             text-align: center;
             font-size: 1.1em;
-        }}
+        }
 
-        .selected-courses {{
+        .selected-courses {
             max-height: 250px;
             overflow-y: auto;
             -webkit-overflow-scrolling: touch;
-        }}
+        }
 
-        .selected-courses::-webkit-scrollbar {{
+        .selected-courses::-webkit-scrollbar {
             width: 4px;
-        }}
+        }
 
-        .selected-courses::-webkit-scrollbar-track {{
+        .selected-courses::-webkit-scrollbar-track {
             background: rgba(255,255,255,0.1);
-        }}
+        }
 
-        .selected-courses::-webkit-scrollbar-thumb {{
+        .selected-courses::-webkit-scrollbar-thumb {
             background: rgba(255,255,255,0.3);
             border-radius: 2px;
-        }}
+        }
 
-        .selected-course-item {{
+        .selected-course-item {
             background: rgba(255,255,255,0.1);
             padding: 8px 10px;
             margin: 4px 0;
@@ -622,15 +786,15 @@ class CourseSimulatorGenerator:
             justify-content: space-between;
             align-items: center;
             font-size: 0.9em;
-        }}
+        }
 
-        .selected-course-item span:first-child {{
+        .selected-course-item span:first-child {
             flex: 1;
             margin-right: 8px;
             word-break: keep-all;
-        }}
+        }
 
-        .total-credits {{
+        .total-credits {
             text-align: center;
             font-size: 1.1em;
             font-weight: bold;
@@ -638,9 +802,9 @@ class CourseSimulatorGenerator:
             padding: 8px;
             background: rgba(255,255,255,0.1);
             border-radius: 5px;
-        }}
+        }
 
-        .export-button {{
+        .export-button {
             background: linear-gradient(135deg, #ff6b35 0%, #ff8e35 100%);
             color: white;
             border: none;
@@ -653,137 +817,137 @@ class CourseSimulatorGenerator:
             margin-top: 15px;
             width: 100%;
             box-shadow: 0 2px 8px rgba(255, 107, 53, 0.3);
-        }}
+        }
 
-        .export-button:hover {{
+        .export-button:hover {
             transform: translateY(-1px);
             box-shadow: 0 4px 12px rgba(255, 107, 53, 0.4);
             background: linear-gradient(135deg, #ff8e35 0%, #ff6b35 100%);
-        }}
+        }
 
-        .export-button:active {{
+        .export-button:active {
             transform: translateY(0);
-        }}
+        }
 
-        .export-button:disabled {{
+        .export-button:disabled {
             background: #ccc;
             cursor: not-allowed;
             transform: none;
             box-shadow: none;
-        }}
+        }
 
         /* 모바일 최적화 */
-        @media (max-width: 768px) {{
-            body {{
+        @media (max-width: 768px) {
+            body {
                 padding: 5px;
                 font-size: 13px;
-            }}
+            }
             
-            .container {{
+            .container {
                 border-radius: 10px;
                 min-height: calc(100vh - 10px);
-            }}
+            }
             
-            .header {{
+            .header {
                 padding: 15px 10px;
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 1.5em;
-            }}
+            }
             
-            .tab {{
+            .tab {
                 padding: 10px 12px;
                 font-size: 0.85em;
                 min-width: 90px;
-            }}
+            }
             
-            .semester-content {{
+            .semester-content {
                 padding: 10px;
-            }}
+            }
             
-            .course-grid {{
+            .course-grid {
                 grid-template-columns: 1fr; 
                 gap: 10px;
-            }}
+            }
             
-            .course-card {{
+            .course-card {
                 padding: 10px;
-            }}
+            }
             
-            .course-name {{
+            .course-name {
                 font-size: 0.95em;
-            }}
+            }
             
-            .course-credit {{
+            .course-credit {
                 font-size: 0.75em;
                 padding: 2px 6px;
-            }}
+            }
             
-            .summary {{
+            .summary {
                 position: static; 
                 margin-top: 15px;
                 padding: 12px;
-            }}
+            }
             
-            .selected-courses {{
+            .selected-courses {
                 max-height: 200px;
-            }}
-        }}
+            }
+        }
 
-        @media (max-width: 480px) {{
-            body {{
+        @media (max-width: 480px) {
+            body {
                 font-size: 12px;
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 1.3em;
-            }}
+            }
             
-            .tab {{
+            .tab {
                 padding: 8px 10px;
                 font-size: 0.8em;
                 min-width: 80px;
-            }}
+            }
             
-            .course-card {{
+            .course-card {
                 padding: 8px;
-            }}
+            }
             
-            .course-name {{
+            .course-name {
                 font-size: 0.9em;
-            }}
+            }
             
-            .course-checkbox input {{
+            .course-checkbox input {
                 transform: scale(1.4); 
-            }}
+            }
             
-            .course-checkbox label {{
+            .course-checkbox label {
                 font-size: 0.85em;
-            }}
-        }}
+            }
+        }
 
-        @media (pointer: coarse) {{
-            .tab {{
+        @media (pointer: coarse) {
+            .tab {
                 min-height: 44px; 
-            }}
+            }
             
-            .course-checkbox {{
+            .course-checkbox {
                 padding: 8px 0; 
-            }}
+            }
             
-            .course-checkbox input {{
+            .course-checkbox input {
                 min-width: 24px; 
                 min-height: 24px;
-            }}
-        }}
+            }
+        }
 
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>🎓 {school_name}</h1>
+            <h1>🎓 __SCHOOL_NAME__</h1>
             <p>과목 선택 시뮬레이션</p>
         </div>
 
@@ -805,464 +969,619 @@ class CourseSimulatorGenerator:
         </div>
     </div>
 
+    <!-- 데이터는 JSON 블록으로 실어 JSON.parse로 읽는다 — JS 리터럴 파싱보다 빠르다 -->
+    <script id="course-data" type="application/json">__COURSE_DATA__</script>
+    <script id="group-limits" type="application/json">__GROUP_LIMITS__</script>
+
     <script>
-        const courseData = {course_data};
-        const groupLimits = {group_limits}; // Key: "학기_선택그룹명"
-        
-        let selectedCourses = {{}}; 
-        let semesterList = [];      
-        let selectionGroups = {{}}; // Key: "학기_선택그룹명", Value: {{ semester, name, limit, selected: [] }}
+        const courseData = JSON.parse(document.getElementById('course-data').textContent);
+        const groupLimits = JSON.parse(document.getElementById('group-limits').textContent); // Key: "학기_선택그룹명"
+
+        let selectedCourses = {}; // 학기 → Map(과목명 → course): O(1) 조회/삭제
+        let semesterList = [];
+        let selectionGroups = {}; // Key: "학기_선택그룹명", Value: { semester, name, limit, selected: Set }
+        let selectionGroupsBySemester = {}; // 학기 → [groupInfo]
+        let courseIndex = {};     // 학기 → {required, bySelectionGroup, generalByGroup} 사전 분류 인덱스
+        let courseByKey = new Map(); // "학기|과목명" → course 객체
 
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             initializeSimulator();
-        }});
+        });
 
-        function initializeSimulator() {{
-            try {{
+        function initializeSimulator() {
+            try {
                 semesterList = [...new Set(courseData.map(course => course.semester))].filter(s => s && String(s).trim() !== "").sort();
-                semesterList.forEach(semester => {{
-                    selectedCourses[semester] = [];
-                }});
-
-                initializeSelectionGroups(); 
+                semesterList.forEach(semester => {
+                    selectedCourses[semester] = new Map();
+                });
+
+                // 과목 객체는 불변이므로 카드 ID·정보 문자열을 1회만 계산해 둔다
+                courseData.forEach(course => {
+                    const safeSemester = safeId(course.semester);
+                    const safeCourseName = String(course.name).replace(/[^a-zA-Z0-9가-힣-_]/g, '');
+                    course._cardId = `course-${safeSemester}-${safeCourseName}`;
+
+                    let infoText = `${course.group || '미분류'} | ${course.type || '정보없음'}`;
+                    // Display selection_group name if it exists, regardless of whether it's a limited group
+                    if (course.selection_group) {
+                        infoText += ` | 그룹: ${course.selection_group}`;
+                    }
+                    if (course.subject) {
+                        infoText += ` | 담당: ${course.subject}`;
+                    }
+                    course._infoText = infoText;
+                    course._creditText = `${course.credits}학점`;
+                });
+
+                initializeSelectionGroups();
+                buildCourseIndex();
 
                 generateTabs();
                 generateSemesterContents(); // This will now build the new structure
 
-                if (semesterList.length > 0) {{
-                    showSemester(semesterList[0]); 
-                }} else {{
+                if (semesterList.length > 0) {
+                    showSemester(semesterList[0]);
+                } else {
                     document.getElementById('semesterContents').innerHTML = '<p style="text-align:center; padding:20px;">표시할 학기 정보가 없습니다. 엑셀 파일의 학기 데이터를 확인해주세요.</p>';
-                    updateSummary(); 
-                }}
+                }
+                updateSummary(); // 자동 선택된 지정과목 포함 초기 요약 구축
 
-                console.log('시뮬레이션 초기화 완료:', {{
+                console.log('시뮬레이션 초기화 완료:', {
                     총과목수: courseData.length,
                     학기목록: semesterList,
                     선택그룹정의_fromPython: groupLimits,
                     활성선택그룹_JS: selectionGroups
-                }});
+                });
                 
-            }} catch (error) {{
+            } catch (error) {
                 console.error('초기화 오류:', error);
                 alert('시뮬레이션 초기화 중 오류가 발생했습니다. 개발자 콘솔을 확인해주세요.');
-            }}
-        }}
+            }
+        }
 
-        function initializeSelectionGroups() {{
-            selectionGroups = {{}}; 
-            for (const key in groupLimits) {{ // groupLimits has "학기_선택그룹명" as key
-                if (groupLimits.hasOwnProperty(key)) {{
+        function initializeSelectionGroups() {
+            selectionGroups = {};
+            selectionGroupsBySemester = {}; // 학기 → [groupInfo] (학기당 전체 스캔 제거)
+            for (const key in groupLimits) { // groupLimits has "학기_선택그룹명" as key
+                if (groupLimits.hasOwnProperty(key)) {
                     const limitInfo = groupLimits[key];
-                    selectionGroups[key] = {{ // JS selectionGroups also uses "학기_선택그룹명" as key
+                    const groupInfo = { // JS selectionGroups also uses "학기_선택그룹명" as key
                         semester: limitInfo.semester,
                         name: limitInfo.group_name, // This is the "선택그룹명"
                         limit: limitInfo.limit,
-                        selected: [] 
-                    }};
-                }}
-            }}
-
-            courseData.forEach(course => {{
-                if (course.required === '지정') {{ 
-                    if (selectedCourses[course.semester] && !selectedCourses[course.semester].find(c => c.name === course.name)) {{
-                         selectedCourses[course.semester].push(course);
-                    }}
-                    
-                    if (course.selection_group) {{ 
-                        const sgKey = `${{course.semester}}_${{course.selection_group}}`; // "학기_선택그룹명"
-                        if (selectionGroups[sgKey]) {{
-                            if (!selectionGroups[sgKey].selected.find(c => c.name === course.name)) {{
-                                selectionGroups[sgKey].selected.push(course);
-                            }}
-                        }} else {{
+                        selected: new Set() // 과목명 Set (멤버십/개수만 필요)
+                    };
+                    selectionGroups[key] = groupInfo;
+                    (selectionGroupsBySemester[groupInfo.semester] ||= []).push(groupInfo);
+                }
+            }
+
+            courseData.forEach(course => {
+                if (course.required === '지정') {
+                    if (selectedCourses[course.semester] && !selectedCourses[course.semester].has(course.name)) {
+                         selectedCourses[course.semester].set(course.name, course);
+                    }
+
+                    if (course.selection_group) {
+                        const sgKey = `${course.semester}_${course.selection_group}`; // "학기_선택그룹명"
+                        if (selectionGroups[sgKey]) {
+                            selectionGroups[sgKey].selected.add(course.name);
+                        } else {
                             // This case means a course has a selection_group, but that group is not defined in groupLimits
                             // This might happen if "그룹 내 선택수" column is missing for some courses with a selection_group name.
-                            console.warn(`선택 그룹 '${{sgKey}}' (과목: ${{course.name}})이 groupLimits에 정의되지 않았습니다. '그룹 내 선택수' 컬럼을 확인해주세요.`);
-                        }}
-                    }}
-                }}
-            }});
-        }}
-
-        function generateTabs() {{
+                            console.warn(`선택 그룹 '${sgKey}' (과목: ${course.name})이 groupLimits에 정의되지 않았습니다. '그룹 내 선택수' 컬럼을 확인해주세요.`);
+                        }
+                    }
+                }
+            });
+        }
+
+        // DOM id용 정제 문자열 메모화 — 학기/그룹명은 유한 집합이라 regex는 키당 1회면 충분
+        const safeIdCache = new Map();
+        function safeId(s) {
+            let v = safeIdCache.get(s);
+            if (v === undefined) {
+                v = String(s).replace(/[^a-zA-Z0-9-_]/g, '');
+                safeIdCache.set(s, v);
+            }
+            return v;
+        }
+
+        // getElementById 결과 캐시 — 정적 골격은 초기 1회만 만들어지므로 무효화할 일이 없다
+        const elCache = {};
+        function byId(id) {
+            return elCache[id] ||= document.getElementById(id);
+        }
+
+        // courseData를 학기별 → (지정/선택그룹/일반 교과군)으로 1회 분류해 두면
+        // 이후 렌더는 필터 스캔 없이 인덱스 조회만으로 끝난다.
+        function buildCourseIndex() {
+            courseIndex = {};
+            courseByKey = new Map(); // `${학기}|${과목명}` → course: 토글 시 선형 탐색 제거
+            courseData.forEach(course => {
+                courseByKey.set(`${course.semester}|${course.name}`, course);
+                const entry = courseIndex[course.semester] ||= { required: [], bySelectionGroup: {}, generalByGroup: {} };
+                if (course.required === '지정') {
+                    entry.required.push(course);
+                    return;
+                }
+                const sgKey = `${course.semester}_${course.selection_group}`;
+                if (course.selection_group && selectionGroups[sgKey]) {
+                    (entry.bySelectionGroup[course.selection_group] ||= []).push(course);
+                } else {
+                    (entry.generalByGroup[course.group || '기타'] ||= []).push(course);
+                }
+            });
+            // 교과군 표시 순서도 여기서 1회만 정렬해 둔다 — 렌더마다 다시 정렬하지 않음
+            for (const semester in courseIndex) {
+                const entry = courseIndex[semester];
+                entry.generalGroupsOrder = Object.keys(entry.generalByGroup).sort();
+            }
+        }
+
+        // 학기명 → 탭 버튼: showSemester가 매번 .tab 전체를 스캔하지 않도록 생성 시점에 기록
+        const tabByName = new Map();
+
+        function generateTabs() {
             const tabsContainer = document.getElementById('tabsContainer');
-            tabsContainer.innerHTML = '';
-            semesterList.forEach((semester, index) => {{
+            const tabsFrag = document.createDocumentFragment();
+            tabByName.clear();
+            semesterList.forEach((semester, index) => {
                 const tab = document.createElement('button');
-                tab.className = `tab ${{index === 0 ? 'active' : ''}}`;
+                tab.className = `tab ${index === 0 ? 'active' : ''}`;
                 tab.textContent = semester;
                 
                 const semesterString = String(semester).replace(/'/g, "\\'"); 
-                tab.setAttribute('onclick', `showSemester('${{semesterString}}')`); 
+                tab.setAttribute('onclick', `showSemester('${semesterString}')`); 
                 
-                tab.addEventListener('touchstart', (e) => {{ e.preventDefault(); showSemester(semester); }}, {{passive: false}});
-                tabsContainer.appendChild(tab);
-            }});
-        }}
+                tab.addEventListener('touchstart', (e) => { e.preventDefault(); showSemester(semester); }, {passive: false});
+                tabByName.set(semester, tab);
+                tabsFrag.appendChild(tab);
+            });
+            tabsContainer.replaceChildren(tabsFrag);
+        }
 
-        function generateSemesterContents() {{
+        function generateSemesterContents() {
             const contentsContainer = document.getElementById('semesterContents');
-            contentsContainer.innerHTML = '';
-
-            semesterList.forEach((semester, index) => {{
+            // 학기 div들을 프래그먼트에 모아 마지막에 1회만 부착
+            const contentsFrag = document.createDocumentFragment();
+
+            // 카드마다 inline onchange를 붙이는 대신 컨테이너 한 곳에서 위임 처리
+            if (!contentsContainer.dataset.delegated) {
+                contentsContainer.dataset.delegated = 'true';
+                contentsContainer.addEventListener('change', (e) => {
+                    const t = e.target;
+                    if (t.matches('input[type=checkbox][data-course-name]')) {
+                        toggleCourse(t.dataset.semester, t.dataset.courseName, t);
+                    }
+                });
+            }
+
+            // 학기별 본문은 탭이 처음 열릴 때 채운다 — 초기에는 빈 자리표시자만 부착
+            semesterList.forEach((semester, index) => {
                 const semesterDiv = document.createElement('div');
-                const safeSemesterId = String(semester).replace(/[^a-zA-Z0-9-_]/g, '');
-                semesterDiv.className = `semester-content ${{index === 0 ? 'active' : ''}}`;
-                semesterDiv.id = `semester-${{safeSemesterId}}`;
-
-                const semesterCourses = courseData.filter(course => course.semester === semester);
-                const requiredCourses = semesterCourses.filter(course => course.required === '지정');
-                const optionalCourses = semesterCourses.filter(course => course.required !== '지정');
-
-                const infoDiv = document.createElement('div');
-                infoDiv.className = 'semester-info';
-                infoDiv.innerHTML = `<h2>${{semester}}</h2><p>지정과목: ${{requiredCourses.length}}개, 선택과목: ${{optionalCourses.length}}개</p>`;
-                semesterDiv.appendChild(infoDiv);
-
-                // 1. 지정 과목 섹션
-                if (requiredCourses.length > 0) {{
-                    const requiredSection = document.createElement('div');
-                    requiredSection.className = 'course-section'; 
-                    requiredSection.innerHTML = `<div class="section-title">📚 지정과목</div><div class="course-grid" id="required-${{safeSemesterId}}"></div>`;
-                    semesterDiv.appendChild(requiredSection);
-                }}
-
-                // 2. 선택 그룹별 과목 (선택 제한이 있는 그룹)
-                //    Iterate over selectionGroups that match the current semester
-                const processedSelectionGroupNames = new Set(); // Track processed group names to avoid duplicate wrappers
-                for (const sgKey in selectionGroups) {{
-                    if (selectionGroups.hasOwnProperty(sgKey) && selectionGroups[sgKey].semester === semester) {{
-                        const groupInfo = selectionGroups[sgKey]; // name here is the "선택그룹명"
-                        const selectionGroupName = groupInfo.name;
-
-                        if (processedSelectionGroupNames.has(selectionGroupName)) continue; // Already created a wrapper for this group name
-
-                        const safeSelectionGroupName = String(selectionGroupName).replace(/[^a-zA-Z0-9-_]/g, '');
-                        const wrapperId = `wrapper-${{safeSemesterId}}-${{safeSelectionGroupName}}`;
-                        const gridId = `grid-${{safeSemesterId}}-${{safeSelectionGroupName}}`;
-                        const countId = `count-${{safeSemesterId}}-${{safeSelectionGroupName}}`;
-
-                        const sgWrapper = document.createElement('div');
-                        sgWrapper.className = 'selection-group-wrapper';
-                        sgWrapper.id = wrapperId; 
-
-                        // Title uses the selectionGroupName. 교과(군) is not part of the main title here.
-                        sgWrapper.innerHTML = `
-                            <div class="selection-group-title">
-                                <span>🎯 ${{selectionGroupName}}</span>
-                                <span class="selection-count" id="${{countId}}">${{groupInfo.selected.length}} / ${{groupInfo.limit}}개 선택</span>
-                            </div>
-                            <div class="course-grid" id="${{gridId}}"></div>`;
-                        semesterDiv.appendChild(sgWrapper);
-                        processedSelectionGroupNames.add(selectionGroupName);
-                    }}
-                }}
+                semesterDiv.className = `semester-content ${index === 0 ? 'active' : ''}`;
+                semesterDiv.id = `semester-${safeId(semester)}`;
+                contentsFrag.appendChild(semesterDiv);
+            });
+            contentsContainer.replaceChildren(contentsFrag);
+        }
+
+        // 학기 본문 1회 구축 (탭 첫 진입 시 호출)
+        const builtSemesters = new Set();
+
+        function buildSemesterDOM(semester) {
+            if (builtSemesters.has(semester)) return;
+            builtSemesters.add(semester);
+
+            const safeSemesterId = safeId(semester);
+            const semesterDiv = byId(`semester-${safeSemesterId}`);
+            if (!semesterDiv) return;
+
+            // courseIndex에 이미 분류돼 있으므로 courseData를 다시 필터링하지 않는다
+            const layout = courseIndex[semester] || { required: [], bySelectionGroup: {}, generalByGroup: {}, generalGroupsOrder: [] };
+            let optionalCount = 0;
+            for (const sg in layout.bySelectionGroup) optionalCount += layout.bySelectionGroup[sg].length;
+            let generalCount = 0;
+            for (const g in layout.generalByGroup) generalCount += layout.generalByGroup[g].length;
+            optionalCount += generalCount;
+
+            const infoDiv = document.createElement('div');
+            infoDiv.className = 'semester-info';
+            infoDiv.innerHTML = `<h2>${semester}</h2><p>지정과목: ${layout.required.length}개, 선택과목: ${optionalCount}개</p>`;
+            semesterDiv.appendChild(infoDiv);
+
+            // 1. 지정 과목 섹션
+            if (layout.required.length > 0) {
+                const requiredSection = document.createElement('div');
+                requiredSection.className = 'course-section'; 
+                requiredSection.innerHTML = `<div class="section-title">📚 지정과목</div><div class="course-grid" id="required-${safeSemesterId}"></div>`;
+                semesterDiv.appendChild(requiredSection);
+            }
+
+            // 2. 선택 그룹별 과목 (선택 제한이 있는 그룹)
+            //    학기별로 미리 분류된 목록 사용 — 키가 "학기_그룹명"이라 이름 중복도 없다
+            (selectionGroupsBySemester[semester] || []).forEach(groupInfo => {
+                const selectionGroupName = groupInfo.name; // "선택그룹명"
+
+                const safeSelectionGroupName = safeId(selectionGroupName);
+                const wrapperId = `wrapper-${safeSemesterId}-${safeSelectionGroupName}`;
+                const gridId = `grid-${safeSemesterId}-${safeSelectionGroupName}`;
+                const countId = `count-${safeSemesterId}-${safeSelectionGroupName}`;
+
+                const sgWrapper = document.createElement('div');
+                sgWrapper.className = 'selection-group-wrapper';
+                sgWrapper.id = wrapperId;
+
+                // Title uses the selectionGroupName. 교과(군) is not part of the main title here.
+                sgWrapper.innerHTML = `
+                    <div class="selection-group-title">
+                        <span>🎯 ${selectionGroupName}</span>
+                        <span class="selection-count" id="${countId}">${groupInfo.selected.size} / ${groupInfo.limit}개 선택</span>
+                    </div>
+                    <div class="course-grid" id="${gridId}"></div>`;
+                semesterDiv.appendChild(sgWrapper);
+            });
                 
-                // 3. 일반 선택 과목 (선택 그룹명이 없거나, 있어도 groupLimits에 정의되지 않은 과목)
-                const generalOptionalCourses = optionalCourses.filter(course => {{
-                    if (!course.selection_group) return true; // No selection group name
-                    const sgKey = `${{course.semester}}_${{course.selection_group}}`;
-                    return !selectionGroups[sgKey]; // Selection group name exists, but not in defined selectionGroups
-                }});
-
-                if (generalOptionalCourses.length > 0) {{
-                    const 교과군들ForGeneral = [...new Set(generalOptionalCourses.map(course => course.group || '기타'))].sort();
-                    교과군들ForGeneral.forEach(교과군_이름 => {{
-                        const safe교과군 = String(교과군_이름).replace(/[^a-zA-Z0-9-_]/g, '');
-                        const sectionId = `section-general-${{safeSemesterId}}-${{safe교과군}}`;
-                        const gridId = `grid-general-${{safeSemesterId}}-${{safe교과군}}`;
+            // 3. 일반 선택 과목 (선택 그룹명이 없거나, 있어도 groupLimits에 정의되지 않은 과목)
+            //    → buildCourseIndex가 이미 generalByGroup으로 분류해 둠
+            if (generalCount > 0) {
+                layout.generalGroupsOrder.forEach(교과군_이름 => {
+                    const safe교과군 = safeId(교과군_이름);
+                    const sectionId = `section-general-${safeSemesterId}-${safe교과군}`;
+                    const gridId = `grid-general-${safeSemesterId}-${safe교과군}`;
                         
-                        const sectionDiv = document.createElement('div');
-                        sectionDiv.className = 'course-section';
-                        sectionDiv.id = sectionId;
-                        sectionDiv.innerHTML = `
-                            <div class="section-title">📖 ${{교과군_이름}} (일반선택)</div>
-                            <div class="course-grid" id="${{gridId}}"></div>`;
-                        semesterDiv.appendChild(sectionDiv);
-                    }});
-                }}
-                contentsContainer.appendChild(semesterDiv);
-            }});
-            
-            // Initial UI update for selection limits after structure is built
-            semesterList.forEach(semester => {{
-                for (const sgKey in selectionGroups) {{
-                    if (selectionGroups.hasOwnProperty(sgKey) && selectionGroups[sgKey].semester === semester) {{
-                        const groupInfo = selectionGroups[sgKey];
-                        updateSelectionLimitUI(semester, groupInfo.name); // Pass selectionGroupName
-                    }}
-                }}
-            }});
-        }}
-
-        function showSemester(semester) {{
-            const safeSemesterId = String(semester).replace(/[^a-zA-Z0-9-_]/g, '');
-            document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
-             const activeTab = Array.from(document.querySelectorAll('.tab')).find(tab => tab.textContent === semester);
+                    const sectionDiv = document.createElement('div');
+                    sectionDiv.className = 'course-section';
+                    sectionDiv.id = sectionId;
+                    sectionDiv.innerHTML = `
+                        <div class="section-title">📖 ${교과군_이름} (일반선택)</div>
+                        <div class="course-grid" id="${gridId}"></div>`;
+                    semesterDiv.appendChild(sectionDiv);
+                });
+            }
+
+            // 구조가 생긴 직후 이 학기의 선택 제한 UI 초기화
+            (selectionGroupsBySemester[semester] || []).forEach(groupInfo => {
+                updateSelectionLimitUI(semester, groupInfo.name); // Pass selectionGroupName
+            });
+        }
+
+        // 같은 프레임에 몰린 갱신 요청을 requestAnimationFrame으로 한 번에 처리
+        let pendingRender = null;
+        const dirtySemesters = new Set();
+
+        function scheduleRender(semester) {
+            if (semester) dirtySemesters.add(semester);
+            if (pendingRender !== null) return;
+            pendingRender = requestAnimationFrame(() => {
+                pendingRender = null;
+                dirtySemesters.forEach(s => renderCourses(s));
+                dirtySemesters.clear();
+            });
+        }
+
+        function showSemester(semester) {
+            const safeSemesterId = safeId(semester);
+            tabByName.forEach(tab => tab.classList.remove('active'));
+            const activeTab = tabByName.get(semester);
             if(activeTab) activeTab.classList.add('active');
-            
+
             document.querySelectorAll('.semester-content').forEach(content => content.classList.remove('active'));
-            const semesterContent = document.getElementById(`semester-${{safeSemesterId}}`);
-            if (semesterContent) {{
+            const semesterContent = byId(`semester-${safeSemesterId}`);
+            if (semesterContent) {
                 semesterContent.classList.add('active');
-                renderCourses(semester); 
-            }}
-            updateSummary(); 
-        }}
-
-        function renderCourses(semester) {{
-            const semesterCourses = courseData.filter(course => course.semester === semester);
-            const safeSemesterId = String(semester).replace(/[^a-zA-Z0-9-_]/g, '');
-
-            // 1. Render 지정 과목
-            const requiredContainer = document.getElementById(`required-${{safeSemesterId}}`);
-            if (requiredContainer) {{
-                requiredContainer.innerHTML = '';
-                semesterCourses.filter(c => c.required === '지정').forEach(course => {{
-                    requiredContainer.appendChild(createCourseCard(course, true));
-                }});
-            }}
-
-            const optionalCourses = semesterCourses.filter(course => course.required !== '지정');
-
-            // 2. Render 과목 in 선택 그룹 (선택 제한 있는 그룹)
-            const processedSelectionGroupNames = new Set();
-            for (const sgKey in selectionGroups) {{
-                if (selectionGroups.hasOwnProperty(sgKey) && selectionGroups[sgKey].semester === semester) {{
-                    const groupInfo = selectionGroups[sgKey];
-                    const selectionGroupName = groupInfo.name;
-                    if (processedSelectionGroupNames.has(selectionGroupName)) continue;
-
-                    const safeSelectionGroupName = String(selectionGroupName).replace(/[^a-zA-Z0-9-_]/g, '');
-                    const gridId = `grid-${{safeSemesterId}}-${{safeSelectionGroupName}}`;
-                    const gridContainer = document.getElementById(gridId);
-
-                    if (gridContainer) {{
-                        gridContainer.innerHTML = '';
-                        // Find all courses for this selection group name in this semester
-                        const coursesForThisGroup = optionalCourses.filter(c => c.selection_group === selectionGroupName);
-                        coursesForThisGroup.forEach(course => {{
-                            gridContainer.appendChild(createCourseCard(course, false));
-                        }});
-                        updateSelectionLimitUI(semester, selectionGroupName);
-                    }} else {{
-                        // console.warn(`선택 그룹 그리드 컨테이너 '${{gridId}}'를 찾을 수 없습니다.`);
-                    }}
-                    processedSelectionGroupNames.add(selectionGroupName);
-                }}
-            }}
-            
-            // 3. Render 일반 선택 과목
-            const generalOptionalCourses = optionalCourses.filter(course => {{
-                if (!course.selection_group) return true;
-                const sgKey = `${{course.semester}}_${{course.selection_group}}`;
-                return !selectionGroups[sgKey];
-            }});
-
-            if (generalOptionalCourses.length > 0) {{
-                const 교과군들ForGeneral = [...new Set(generalOptionalCourses.map(course => course.group || '기타'))].sort();
-                교과군들ForGeneral.forEach(교과군_이름 => {{
-                    const safe교과군 = String(교과군_이름).replace(/[^a-zA-Z0-9-_]/g, '');
-                    const gridId = `grid-general-${{safeSemesterId}}-${{safe교과군}}`;
-                    const gridContainer = document.getElementById(gridId);
-                    if (gridContainer) {{
-                        gridContainer.innerHTML = '';
-                        const coursesForThis교과군 = generalOptionalCourses.filter(c => (c.group || '기타') === 교과군_이름);
-                        coursesForThis교과군.forEach(course => {{
-                            gridContainer.appendChild(createCourseCard(course, false));
-                        }});
-                    }} else {{
-                        // console.warn(`일반 선택용 그리드 컨테이너 '${{gridId}}'를 찾을 수 없습니다.`);
-                    }}
-                }});
-            }}
-        }}
-
-        function createCourseCard(course, isRequired) {{
-            const card = document.createElement('div');
-            card.className = 'course-card';
-            if (isRequired) card.classList.add('required');
-
-            const isSelected = selectedCourses[course.semester]?.some(c => c.name === course.name);
-            if (isSelected) card.classList.add('selected');
-            
-            const safeSemester = String(course.semester).replace(/[^a-zA-Z0-9-_]/g, '');
-            const safeCourseName = String(course.name).replace(/[^a-zA-Z0-9가-힣-_]/g, '');
-            const courseId = `course-${{safeSemester}}-${{safeCourseName}}`;
-            let isDisabled = false;
-
-            if (!isRequired && course.selection_group) {{ // Check if it belongs to any selection_group
-                const sgKey = `${{course.semester}}_${{course.selection_group}}`;
-                const groupInfo = selectionGroups[sgKey]; // Check if this group is a defined limited group
-                if (groupInfo && groupInfo.selected.length >= groupInfo.limit && !isSelected) {{
-                    isDisabled = true;
-                }}
-            }}
-            if (isDisabled) card.classList.add('disabled');
-
-            let infoText = `${{course.group || '미분류'}} | ${{course.type || '정보없음'}}`;
-            // Display selection_group name if it exists, regardless of whether it's a limited group
-            if (course.selection_group) {{ 
-                 infoText += ` | 그룹: ${{course.selection_group}}`;
-            }}
-            if(course.subject) {{ 
-                infoText += ` | 담당: ${{course.subject}}`;
-            }}
-
-            const escapedSemester = String(course.semester).replace(/'/g, "\\\\'");
-            const escapedCourseName = String(course.name).replace(/'/g, "\\\\'");  
-
-            card.innerHTML = `
-                <div> 
+                buildSemesterDOM(semester); // 첫 진입이면 이때 본문 구축
+                scheduleRender(semester);
+            } else {
+                scheduleRender();
+            }
+        }
+
+        function renderCourses(semester) {
+            const layout = courseIndex[semester];
+            if (!layout) return;
+            const safeSemesterId = safeId(semester);
+
+            // 읽기 단계: 대상 요소와 새 프래그먼트/상태를 전부 수집 (DOM 변경 없음)
+            const gridWrites = [];
+            const limitWrites = [];
+            const collectGrid = (gridContainer, courses, isRequired) => {
+                if (!gridContainer) return;
+                const frag = document.createDocumentFragment();
+                courses.forEach(course => {
+                    frag.appendChild(createCourseCard(course, isRequired));
+                });
+                gridWrites.push({ gridContainer, frag });
+            };
+
+            // 1. 지정 과목
+            collectGrid(byId(`required-${safeSemesterId}`), layout.required, true);
+
+            // 2. 선택 그룹 (선택 제한 있는 그룹)
+            for (const selectionGroupName in layout.bySelectionGroup) {
+                const safeSelectionGroupName = safeId(selectionGroupName);
+                collectGrid(byId(`grid-${safeSemesterId}-${safeSelectionGroupName}`),
+                            layout.bySelectionGroup[selectionGroupName], false);
+                const limitState = computeSelectionLimitState(semester, selectionGroupName);
+                if (limitState) limitWrites.push(limitState);
+            }
+
+            // 3. 일반 선택 과목 (교과군별)
+            layout.generalGroupsOrder.forEach(교과군_이름 => {
+                const safe교과군 = safeId(교과군_이름);
+                collectGrid(byId(`grid-general-${safeSemesterId}-${safe교과군}`),
+                            layout.generalByGroup[교과군_이름], false);
+            });
+
+            // 쓰기 단계: 모아둔 DOM 변경을 한 번에 적용 (읽기/쓰기 교차로 인한 강제 레이아웃 방지)
+            gridWrites.forEach(({ gridContainer, frag }) => gridContainer.replaceChildren(frag));
+            limitWrites.forEach(applySelectionLimitState);
+        }
+
+        // 카드 구조는 <template> 1회 파싱 후 cloneNode로 복제 — 카드마다 HTML 파서를 돌리지 않는다
+        const cardTemplate = document.createElement('template');
+        cardTemplate.innerHTML = `
+            <div class="course-card">
+                <div>
                     <div class="course-header">
-                        <div class="course-name">${{course.name}}</div>
-                        <div class="course-credit">${{course.credits}}학점</div>
+                        <div class="course-name"></div>
+                        <div class="course-credit"></div>
                     </div>
-                    <div class="course-info">${{infoText}}</div>
+                    <div class="course-info"></div>
                 </div>
-                <div> 
-                ${{isRequired ? `<div class="required-notice">✓ 지정과목 (자동 선택)</div>` : `
+                <div>
+                    <div class="required-notice">✓ 지정과목 (자동 선택)</div>
                     <div class="course-checkbox">
-                        <input type="checkbox" id="${{courseId}}" 
-                               ${{isSelected ? 'checked' : ''}} 
-                               ${{isDisabled ? 'disabled' : ''}}
-                               onchange="toggleCourse('${{escapedSemester}}', '${{escapedCourseName}}', this)">
-                        <label for="${{courseId}}">선택</label>
+                        <input type="checkbox">
+                        <label>선택</label>
                     </div>
-                `}}
                 </div>
-            `;
+            </div>`;
+
+        function createCourseCard(course, isRequired) {
+            const card = cardTemplate.content.firstElementChild.cloneNode(true);
+            card.dataset.courseName = course.name; // 부분 갱신 시 카드 식별용
+
+            const isSelected = selectedCourses[course.semester]?.has(course.name);
+            // 클래스는 문자열로 한 번에 조립해 className 1회 쓰기로 끝낸다
+            // (정원 초과 잠금은 그리드 컨테이너의 data-limit-reached 속성이 CSS로 처리)
+            let cls = 'course-card';
+            if (isRequired) cls += ' required';
+            if (isSelected) cls += ' selected';
+            card.className = cls;
+
+            // textContent 사용으로 과목명 HTML 이스케이프 문제도 함께 사라진다
+            card.querySelector('.course-name').textContent = course.name;
+            card.querySelector('.course-credit').textContent = course._creditText;
+            card.querySelector('.course-info').textContent = course._infoText;
+
+            const checkboxWrap = card.querySelector('.course-checkbox');
+            if (isRequired) {
+                checkboxWrap.remove();
+            } else {
+                card.querySelector('.required-notice').remove();
+                const input = checkboxWrap.querySelector('input');
+                input.id = course._cardId;
+                input.checked = !!isSelected;
+                input.dataset.semester = course.semester;
+                input.dataset.courseName = course.name;
+                checkboxWrap.querySelector('label').htmlFor = course._cardId;
+            }
             return card;
-        }}
+        }
 
-        function toggleCourse(semester, courseName, checkbox) {{
-            const course = courseData.find(c => c.semester === semester && c.name === courseName);
+        function toggleCourse(semester, courseName, checkbox) {
+            const course = courseByKey.get(`${semester}|${courseName}`);
             if (!course) return;
 
-            const isCurrentlySelected = selectedCourses[semester]?.some(c => c.name === courseName);
+            const isCurrentlySelected = selectedCourses[semester]?.has(courseName);
 
-            if (checkbox.checked && !isCurrentlySelected) {{ 
-                if (course.selection_group) {{ // If the course belongs to a selection_group
-                    const sgKey = `${{semester}}_${{course.selection_group}}`;
+            if (checkbox.checked && !isCurrentlySelected) {
+                if (course.selection_group) { // If the course belongs to a selection_group
+                    const sgKey = `${semester}_${course.selection_group}`;
                     const groupInfo = selectionGroups[sgKey]; // Check if it's a defined limited group
-                    if (groupInfo && groupInfo.selected.length >= groupInfo.limit) {{
-                        checkbox.checked = false; 
-                        alert(`'${{groupInfo.name}}' 그룹은 최대 ${{groupInfo.limit}}개까지만 선택할 수 있습니다.`);
+                    if (groupInfo && groupInfo.selected.size >= groupInfo.limit) {
+                        checkbox.checked = false;
+                        alert(`'${groupInfo.name}' 그룹은 최대 ${groupInfo.limit}개까지만 선택할 수 있습니다.`);
                         return;
-                    }}
-                    if (groupInfo) groupInfo.selected.push(course); // Add to selectionGroups only if it's a defined limited group
-                }}
-                selectedCourses[semester].push(course);
-            }} else if (!checkbox.checked && isCurrentlySelected) {{ 
-                if (course.selection_group) {{
-                    const sgKey = `${{semester}}_${{course.selection_group}}`;
+                    }
+                    if (groupInfo) groupInfo.selected.add(courseName); // Add to selectionGroups only if it's a defined limited group
+                }
+                selectedCourses[semester].set(courseName, course);
+                addSummaryRow(semester, course);
+            } else if (!checkbox.checked && isCurrentlySelected) {
+                if (course.selection_group) {
+                    const sgKey = `${semester}_${course.selection_group}`;
                     const groupInfo = selectionGroups[sgKey];
-                    if (groupInfo) {{ // Remove from selectionGroups only if it's a defined limited group
-                        groupInfo.selected = groupInfo.selected.filter(c => c.name !== courseName);
-                    }}
-                }}
-                selectedCourses[semester] = selectedCourses[semester].filter(c => c.name !== courseName);
-            }}
+                    if (groupInfo) { // Remove from selectionGroups only if it's a defined limited group
+                        groupInfo.selected.delete(courseName);
+                    }
+                }
+                selectedCourses[semester].delete(courseName);
+                removeSummaryRow(semester, course);
+            }
             
             checkbox.closest('.course-card').classList.toggle('selected', checkbox.checked);
 
-            if (course.selection_group) {{ 
-                 // Update UI for this specific selection group name
+            if (course.selection_group) {
+                 // 그룹 UI(카운트/정원 잠금)는 DOM 쓰기 3회로 끝난다 — 카드 순회 없음
                  updateSelectionLimitUI(semester, course.selection_group);
-            }}
-            
-            renderCourses(semester); // Re-render to update disabled states of other cards
-            updateSummary();
-        }}
+            }
+        }
 
-        // Updated: 교과군_이름 parameter is removed as it's not needed to identify the selection group UI elements
-        function updateSelectionLimitUI(semester, selectionGroupName) {{
-            if (!selectionGroupName) return; 
+        // 마지막으로 DOM에 반영한 그룹별 선택수 — 같은 값이면 쓰기를 건너뛴다 (limit은 불변)
+        const lastLimitState = new Map();
+
+        // 읽기 단계: 선택 그룹 UI에 반영할 상태만 계산한다 (DOM 변경 없음)
+        function computeSelectionLimitState(semester, selectionGroupName) {
+            if (!selectionGroupName) return null;
 
-            const sgDataKey = `${{semester}}_${{selectionGroupName}}`; 
+            const sgDataKey = `${semester}_${selectionGroupName}`;
             const groupInfo = selectionGroups[sgDataKey]; // Get info for this selection group
-            if (!groupInfo) {{ // Not a defined limited group, or no limit info
-                return;
-            }}
-            
-            const safeSemesterId = String(semester).replace(/[^a-zA-Z0-9-_]/g, '');
-            const safeSelectionGroupName = String(selectionGroupName).replace(/[^a-zA-Z0-9-_]/g, '');
-            
+            if (!groupInfo) { // Not a defined limited group, or no limit info
+                return null;
+            }
+
+            if (lastLimitState.get(sgDataKey) === groupInfo.selected.size) {
+                return null; // 이미 반영된 값 — 불필요한 스타일 무효화 방지
+            }
+            lastLimitState.set(sgDataKey, groupInfo.selected.size);
+
+            const safeSemesterId = safeId(semester);
+            const safeSelectionGroupName = safeId(selectionGroupName);
+
             // DOM IDs are now based on semester and selectionGroupName only
-            const countId = `count-${{safeSemesterId}}-${{safeSelectionGroupName}}`;
-            const wrapperId = `wrapper-${{safeSemesterId}}-${{safeSelectionGroupName}}`;
-
-            const countElement = document.getElementById(countId);
-            const wrapperElement = document.getElementById(wrapperId); 
-
-            if (countElement) {{
-                countElement.textContent = `${{groupInfo.selected.length}} / ${{groupInfo.limit}}개 선택`;
-            }}
-            if (wrapperElement) {{
-                wrapperElement.classList.toggle('selection-limit-reached', groupInfo.selected.length >= groupInfo.limit);
-            }}
-        }}
-
-        function updateSummary() {{
-            const summaryList = document.getElementById('summaryList');
-            const totalCreditsElement = document.getElementById('totalCredits');
-            const exportBtn = document.getElementById('exportBtn');
-            
-            summaryList.innerHTML = '';
-            let totalCredits = 0;
-            let hasSelectedCourses = false;
-
-            semesterList.forEach(semester => {{
-                const courses = selectedCourses[semester] || [];
-                if (courses.length > 0) {{
-                    hasSelectedCourses = true;
-                    const semesterHeader = document.createElement('div');
-                    semesterHeader.innerHTML = `<strong>${{semester}} (${{courses.length}}과목)</strong>`;
-                    semesterHeader.style.cssText = `margin-top: 10px; padding-bottom: 5px; border-bottom: 1px solid rgba(255,255,255,0.2); font-size: 0.95em;`;
-                    if (summaryList.children.length > 0) semesterHeader.style.marginTop = '15px'; 
-                    summaryList.appendChild(semesterHeader);
-
-                    courses.forEach(course => {{
-                        const item = document.createElement('div');
-                        item.className = 'selected-course-item';
-                        item.innerHTML = `<span>${{course.name}}</span><span>${{course.credits}}학점</span>`;
-                        summaryList.appendChild(item);
-                        totalCredits += Number(course.credits) || 0; 
-                    }});
-                }}
-            }});
-            
-            totalCreditsElement.textContent = `총 선택 학점: ${{totalCredits}}학점`;
-            
-            if (summaryList.innerHTML === '') {{
-                summaryList.innerHTML = '<p style="text-align:center; opacity:0.7; padding:10px 0;">선택된 과목이 없습니다.</p>';
-            }}
+            return {
+                countElement: byId(`count-${safeSemesterId}-${safeSelectionGroupName}`),
+                wrapperElement: byId(`wrapper-${safeSemesterId}-${safeSelectionGroupName}`),
+                gridElement: byId(`grid-${safeSemesterId}-${safeSelectionGroupName}`),
+                countText: `${groupInfo.selected.size} / ${groupInfo.limit}개 선택`,
+                limitReached: groupInfo.selected.size >= groupInfo.limit,
+            };
+        }
+
+        // 쓰기 단계: 계산된 상태를 적용만 한다
+        function applySelectionLimitState(state) {
+            if (state.countElement) {
+                state.countElement.textContent = state.countText;
+            }
+            if (state.wrapperElement) {
+                state.wrapperElement.classList.toggle('selection-limit-reached', state.limitReached);
+            }
+            if (state.gridElement) {
+                // 미선택 카드 잠금은 CSS 속성 선택자가 처리 — 카드별 class/disabled 조작 불필요
+                if (state.limitReached) {
+                    state.gridElement.dataset.limitReached = '1';
+                } else {
+                    delete state.gridElement.dataset.limitReached;
+                }
+            }
+        }
+
+        // Updated: 교과군_이름 parameter is removed as it's not needed to identify the selection group UI elements
+        function updateSelectionLimitUI(semester, selectionGroupName) {
+            const state = computeSelectionLimitState(semester, selectionGroupName);
+            if (state) applySelectionLimitState(state);
+        }
+
+        // 요약 패널은 행 단위로 증분 갱신한다 (토글마다 전체 innerHTML 재구축 금지)
+        const summaryRows = new Map();      // `${semester}|${과목명}` → row element
+        const summarySections = new Map();  // semester → {section, header, count}
+        let summaryTotalCredits = 0;
+        let summaryEmptyNotice = null;
+
+        function getSummarySection(semester) {
+            let info = summarySections.get(semester);
+            if (info) return info;
+
+            const summaryList = byId('summaryList');
+            if (summaryEmptyNotice) { summaryEmptyNotice.remove(); summaryEmptyNotice = null; }
+
+            const section = document.createElement('div');
+            const header = document.createElement('div');
+            header.style.cssText = `margin-top: 10px; padding-bottom: 5px; border-bottom: 1px solid rgba(255,255,255,0.2); font-size: 0.95em;`;
+            section.appendChild(header);
+
+            // 학기 순서를 유지하도록 다음 학기 섹션 앞에 삽입
+            const idx = semesterList.indexOf(semester);
+            let before = null;
+            let beforeIdx = Infinity;
+            summarySections.forEach((other, otherSemester) => {
+                const otherIdx = semesterList.indexOf(otherSemester);
+                if (otherIdx > idx && otherIdx < beforeIdx) { before = other.section; beforeIdx = otherIdx; }
+            });
+            summaryList.insertBefore(section, before);
+            if (section !== summaryList.firstChild) header.style.marginTop = '15px';
+
+            info = { section, header, count: 0 };
+            summarySections.set(semester, info);
+            return info;
+        }
+
+        function addSummaryRow(semester, course) {
+            const info = getSummarySection(semester);
+            const row = document.createElement('div');
+            row.className = 'selected-course-item';
+            row.innerHTML = `<span>${course.name}</span><span>${course.credits}학점</span>`;
+            info.section.appendChild(row);
+            info.count++;
+            info.header.innerHTML = `<strong>${semester} (${info.count}과목)</strong>`;
+            summaryRows.set(`${semester}|${course.name}`, row);
+            summaryTotalCredits += Number(course.credits) || 0;
+            refreshSummaryTotals();
+        }
+
+        function removeSummaryRow(semester, course) {
+            const key = `${semester}|${course.name}`;
+            const row = summaryRows.get(key);
+            if (!row) return;
+            row.remove();
+            summaryRows.delete(key);
+
+            const info = summarySections.get(semester);
+            if (info) {
+                info.count--;
+                if (info.count <= 0) {
+                    info.section.remove();
+                    summarySections.delete(semester);
+                } else {
+                    info.header.innerHTML = `<strong>${semester} (${info.count}과목)</strong>`;
+                }
+            }
+            summaryTotalCredits -= Number(course.credits) || 0;
+            refreshSummaryTotals();
+        }
+
+        function refreshSummaryTotals() {
+            byId('totalCredits').textContent = `총 선택 학점: ${summaryTotalCredits}학점`;
+
+            if (summaryRows.size === 0 && !summaryEmptyNotice) {
+                summaryEmptyNotice = document.createElement('p');
+                summaryEmptyNotice.style.cssText = 'text-align:center; opacity:0.7; padding:10px 0;';
+                summaryEmptyNotice.textContent = '선택된 과목이 없습니다.';
+                byId('summaryList').appendChild(summaryEmptyNotice);
+            }
 
             // Enable/disable export button based on selected courses
-            exportBtn.disabled = !hasSelectedCourses;
-        }}
+            byId('exportBtn').disabled = summaryRows.size === 0;
+        }
+
+        function updateSummary() {
+            // 초기 로드 시 1회 전체 구축 — 이후 변경은 add/removeSummaryRow로만 반영
+            const summaryList = byId('summaryList');
+            summaryList.innerHTML = '';
+            summaryRows.clear();
+            summarySections.clear();
+            summaryTotalCredits = 0;
+            summaryEmptyNotice = null;
+
+            semesterList.forEach(semester => {
+                selectedCourses[semester]?.forEach(course => addSummaryRow(semester, course));
+            });
+            refreshSummaryTotals();
+        }
 
-        function exportToPDF() {{
-            try {{
+        function exportToPDF() {
+            try {
                 // Check if required libraries are available
-                if (typeof window.jspdf === 'undefined' || typeof html2canvas === 'undefined') {{
+                if (typeof window.jspdf === 'undefined' || typeof html2canvas === 'undefined') {
                     alert('PDF 생성 라이브러리를 로드할 수 없습니다. 페이지를 새로고침 후 다시 시도해주세요.');
                     return;
-                }}
+                }
 
                 // Get student information
                 const studentNumber = prompt('학번을 입력하세요:');
-                if (!studentNumber || !studentNumber.trim()) {{
+                if (!studentNumber || !studentNumber.trim()) {
                     alert('학번을 입력해야 합니다.');
                     return;
-                }}
+                }
 
                 const studentName = prompt('이름을 입력하세요:');
-                if (!studentName || !studentName.trim()) {{
+                if (!studentName || !studentName.trim()) {
                     alert('이름을 입력해야 합니다.');
                     return;
-                }}
+                }
 
                 // Show loading message
                 const exportBtn = document.getElementById('exportBtn');
@@ -1271,30 +1590,30 @@ class CourseSimulatorGenerator:
                 exportBtn.disabled = true;
 
                 // 선택된 과목을 교과(군)별로 정리
-                const coursesByGroup = {{}};
+                const coursesByGroup = {};
                 let totalSelectedCredits = 0;
 
-                semesterList.forEach(semester => {{
-                    const courses = selectedCourses[semester] || [];
-                    courses.forEach(course => {{
+                semesterList.forEach(semester => {
+                    const courses = selectedCourses[semester] || new Map();
+                    courses.forEach(course => {
                         const groupName = course.group || '기타';
-                        if (!coursesByGroup[groupName]) {{
+                        if (!coursesByGroup[groupName]) {
                             coursesByGroup[groupName] = [];
-                        }}
-                        coursesByGroup[groupName].push({{
+                        }
+                        coursesByGroup[groupName].push({
                             ...course,
                             semester: semester
-                        }});
+                        });
                         totalSelectedCredits += Number(course.credits) || 0;
-                    }});
-                }});
+                    });
+                });
 
-                if (Object.keys(coursesByGroup).length === 0) {{
+                if (Object.keys(coursesByGroup).length === 0) {
                     alert('선택된 과목이 없습니다.');
                     exportBtn.textContent = originalText;
                     exportBtn.disabled = false;
                     return;
-                }}
+                }
 
                 // Create a temporary div with the report content
                 const reportDiv = document.createElement('div');
@@ -1311,35 +1630,35 @@ class CourseSimulatorGenerator:
                 `;
 
                 // Build the HTML content
-                const schoolName = '{school_name}';
+                const schoolName = '__SCHOOL_NAME__';
                 const today = new Date().toLocaleDateString('ko-KR');
                 const sortedGroups = Object.keys(coursesByGroup).sort();
                 const totalCourses = Object.values(coursesByGroup).flat().length;
 
                 let htmlContent = `
                     <div style="text-align: center; margin-bottom: 40px;">
-                        <h1 style="font-size: 28px; margin-bottom: 10px; color: #2c3e50;">${{schoolName}}</h1>
+                        <h1 style="font-size: 28px; margin-bottom: 10px; color: #2c3e50;">${schoolName}</h1>
                         <h2 style="font-size: 22px; margin-bottom: 20px; color: #34495e;">과목 선택 계획서</h2>
                         <div style="font-size: 16px; margin-bottom: 10px;">
-                            <strong>학번:</strong> ${{studentNumber.trim()}} &nbsp;&nbsp;&nbsp; 
-                            <strong>이름:</strong> ${{studentName.trim()}}
+                            <strong>학번:</strong> ${studentNumber.trim()} &nbsp;&nbsp;&nbsp; 
+                            <strong>이름:</strong> ${studentName.trim()}
                         </div>
-                        <p style="font-size: 14px; color: #7f8c8d;">생성 날짜: ${{today}}</p>
+                        <p style="font-size: 14px; color: #7f8c8d;">생성 날짜: ${today}</p>
                     </div>
                     
                     <div style="margin-bottom: 30px; padding: 20px; background: #f8f9fa; border-radius: 8px;">
                         <h3 style="font-size: 18px; margin-bottom: 15px; color: #2c3e50;">📊 선택 결과 요약</h3>
                         <div style="display: flex; justify-content: space-around; text-align: center;">
                             <div>
-                                <div style="font-size: 24px; font-weight: bold; color: #e74c3c;">${{totalSelectedCredits}}</div>
+                                <div style="font-size: 24px; font-weight: bold; color: #e74c3c;">${totalSelectedCredits}</div>
                                 <div style="font-size: 14px; color: #7f8c8d;">총 학점</div>
                             </div>
                             <div>
-                                <div style="font-size: 24px; font-weight: bold; color: #3498db;">${{totalCourses}}</div>
+                                <div style="font-size: 24px; font-weight: bold; color: #3498db;">${totalCourses}</div>
                                 <div style="font-size: 14px; color: #7f8c8d;">총 과목 수</div>
                             </div>
                             <div>
-                                <div style="font-size: 24px; font-weight: bold; color: #27ae60;">${{sortedGroups.length}}</div>
+                                <div style="font-size: 24px; font-weight: bold; color: #27ae60;">${sortedGroups.length}</div>
                                 <div style="font-size: 14px; color: #7f8c8d;">교과(군) 수</div>
                             </div>
                         </div>
@@ -1348,14 +1667,14 @@ class CourseSimulatorGenerator:
                     <h3 style="font-size: 20px; margin-bottom: 25px; color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">📚 교과(군)별 선택 과목</h3>
                 `;
 
-                sortedGroups.forEach(groupName => {{
+                sortedGroups.forEach(groupName => {
                     const groupCourses = coursesByGroup[groupName];
                     const groupCredits = groupCourses.reduce((sum, course) => sum + (Number(course.credits) || 0), 0);
 
                     htmlContent += `
                         <div style="margin-bottom: 30px; border: 1px solid #ddd; border-radius: 8px; overflow: hidden;">
                             <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px;">
-                                <h4 style="margin: 0; font-size: 18px; font-weight: bold;">${{groupName}} (총 ${{groupCredits}}학점)</h4>
+                                <h4 style="margin: 0; font-size: 18px; font-weight: bold;">${groupName} (총 ${groupCredits}학점)</h4>
                             </div>
                             <div style="padding: 20px;">
                                 <table style="width: 100%; border-collapse: collapse;">
@@ -1370,7 +1689,7 @@ class CourseSimulatorGenerator:
                                     <tbody>
                     `;
 
-                    groupCourses.forEach((course, index) => {{
+                    groupCourses.forEach((course, index) => {
                         const bgColor = index % 2 === 0 ? 'white' : '#f8f9fa';
                         const courseType = course.type || '미분류';
                         
@@ -1382,18 +1701,18 @@ class CourseSimulatorGenerator:
                         else if (courseType.includes('융합선택')) typeColor = '#6f42c1';
                         
                         htmlContent += `
-                            <tr style="background: ${{bgColor}};">
-                                <td style="padding: 12px; border: 1px solid #dee2e6;">${{course.name}}</td>
+                            <tr style="background: ${bgColor};">
+                                <td style="padding: 12px; border: 1px solid #dee2e6;">${course.name}</td>
                                 <td style="padding: 12px; border: 1px solid #dee2e6; text-align: center;">
-                                    <span style="background: ${{typeColor}}; color: white; padding: 4px 8px; border-radius: 4px; font-size: 12px; font-weight: bold;">
-                                        ${{courseType}}
+                                    <span style="background: ${typeColor}; color: white; padding: 4px 8px; border-radius: 4px; font-size: 12px; font-weight: bold;">
+                                        ${courseType}
                                     </span>
                                 </td>
-                                <td style="padding: 12px; border: 1px solid #dee2e6; text-align: center; font-weight: bold; color: #e74c3c;">${{course.credits}}</td>
-                                <td style="padding: 12px; border: 1px solid #dee2e6; text-align: center;">${{course.semester}}</td>
+                                <td style="padding: 12px; border: 1px solid #dee2e6; text-align: center; font-weight: bold; color: #e74c3c;">${course.credits}</td>
+                                <td style="padding: 12px; border: 1px solid #dee2e6; text-align: center;">${course.semester}</td>
                             </tr>
                         `;
-                    }});
+                    });
 
                     htmlContent += `
                                     </tbody>
@@ -1401,28 +1720,28 @@ class CourseSimulatorGenerator:
                             </div>
                         </div>
                     `;
-                }});
+                });
 
                 reportDiv.innerHTML = htmlContent;
                 document.body.appendChild(reportDiv);
 
                 // Generate PDF using html2canvas + jsPDF
-                html2canvas(reportDiv, {{
+                html2canvas(reportDiv, {
                     scale: 2,
                     useCORS: true,
                     allowTaint: true,
                     backgroundColor: '#ffffff',
                     width: 800,
                     height: reportDiv.scrollHeight
-                }}).then(canvas => {{
+                }).then(canvas => {
                     const imgData = canvas.toDataURL('image/png');
                     
-                    const {{ jsPDF }} = window.jspdf;
-                    const pdf = new jsPDF({{
+                    const { jsPDF } = window.jspdf;
+                    const pdf = new jsPDF({
                         orientation: 'portrait',
                         unit: 'mm',
                         format: 'a4'
-                    }});
+                    });
 
                     const imgWidth = 190; // A4 width minus margins
                     const pageHeight = 277; // A4 height minus margins
@@ -1435,12 +1754,12 @@ class CourseSimulatorGenerator:
                     heightLeft -= pageHeight;
 
                     // Add additional pages if needed
-                    while (heightLeft >= 0) {{
+                    while (heightLeft >= 0) {
                         position = heightLeft - imgHeight + 10;
                         pdf.addPage();
                         pdf.addImage(imgData, 'PNG', 10, position, imgWidth, imgHeight);
                         heightLeft -= pageHeight;
-                    }}
+                    }
 
                     // Clean up
                     document.body.removeChild(reportDiv);
@@ -1448,7 +1767,7 @@ class CourseSimulatorGenerator:
                     // Generate filename with student info
                     const safeStudentNumber = studentNumber.trim().replace(/[^a-zA-Z0-9가-힣]/g, '');
                     const safeStudentName = studentName.trim().replace(/[^a-zA-Z0-9가-힣]/g, '');
-                    const filename = `${{safeStudentNumber}}_${{safeStudentName}}_과목선택계획서.pdf`;
+                    const filename = `${safeStudentNumber}_${safeStudentName}_과목선택계획서.pdf`;
                     
                     pdf.save(filename);
                     
@@ -1456,32 +1775,37 @@ class CourseSimulatorGenerator:
                     exportBtn.textContent = originalText;
                     exportBtn.disabled = false;
                     
-                    alert(`PDF 파일이 다운로드되었습니다: ${{filename}}`);
+                    alert(`PDF 파일이 다운로드되었습니다: ${filename}`);
                     
-                }}).catch(error => {{
+                }).catch(error => {
                     console.error('PDF 생성 오류:', error);
                     document.body.removeChild(reportDiv);
                     exportBtn.textContent = originalText;
                     exportBtn.disabled = false;
-                    alert(`PDF 생성 중 오류가 발생했습니다: ${{error.message}}`);
-                }});
+                    alert(`PDF 생성 중 오류가 발생했습니다: ${error.message}`);
+                });
 
-            }} catch (error) {{
+            } catch (error) {
                 console.error('PDF 생성 오류:', error);
                 const exportBtn = document.getElementById('exportBtn');
                 exportBtn.textContent = '📄 PDF로 내보내기';
                 exportBtn.disabled = false;
-                alert(`PDF 생성 중 오류가 발생했습니다: ${{error.message}}`);
-            }}
-        }}
-        
-        document.addEventListener('touchstart', function() {{}}, {{passive: true}});
+                alert(`PDF 생성 중 오류가 발생했습니다: ${error.message}`);
+            }
+        }
     </script>
 </body>
 </html>'''
 
+_MINIFIED_HTML_TEMPLATE = _minify_template(_HTML_TEMPLATE)
+
+# 센티널 기준 분할도 모듈 로드 시 1회 — generate_html은 조각을 치환하며 쓰기만 한다
+_TEMPLATE_PARTS = re.split(r'(__SCHOOL_NAME__|__COURSE_DATA__|__GROUP_LIMITS__)',
+                           _MINIFIED_HTML_TEMPLATE)
+
 def create_gui():
     """GUI 인터페이스 생성"""
+    _import_tk()
     root = tk.Tk()
     root.title("과목 선택 시뮬레이션 생성기")
     root.geometry("550x350") 
@@ -1559,12 +1883,44 @@ def process_file(parent_window, status_label_widget):
         status_label_widget.config(text="HTML 생성 실패.")
 
 
+def _generate_one(file_path):
+    """워커 프로세스에서 워크북 1개를 HTML로 변환"""
+    generator = CourseSimulatorGenerator()
+    if generator.load_excel_data(file_path) and generator.process_data():
+        return generator.generate_html()
+    return False
+
+
+def generate_for_files(file_paths):
+    """여러 워크북을 프로세스 풀로 병렬 변환 (학교별 배치 실행용)
+
+    각 워커가 독립적으로 로드→처리→생성을 수행하므로 공유 상태가 없다.
+    반환값은 입력 순서대로의 생성 파일 경로 (실패 시 False).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_generate_one, file_paths))
+
+
 def main():
     """메인 함수"""
     print("🎓 과목 선택 시뮬레이션 HTML 생성기")
     print("=" * 50)
 
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 2:
+        # 여러 파일을 받으면 배치 모드: 프로세스 풀로 병렬 생성
+        file_paths = [p for p in sys.argv[1:] if os.path.exists(p) or
+                      print(f"❌ 지정된 파일을 찾을 수 없습니다: {p}")]
+        if not file_paths:
+            return
+        print(f"배치 모드로 실행: {len(file_paths)}개 파일")
+        results = generate_for_files(file_paths)
+        for path, result in zip(file_paths, results):
+            if result:
+                print(f"🎉 {path} → {result}")
+            else:
+                print(f"❌ 변환 실패: {path}")
+    elif len(sys.argv) > 1:
         file_path = sys.argv[1]
         if not os.path.exists(file_path):
             print(f"❌ 지정된 파일을 찾을 수 없습니다: {file_path}")
@@ -1593,7 +1949,7 @@ def main():
             print(f"GUI 실행 중 예상치 못한 오류 발생: {e}")
             try:
                 messagebox.showerror("치명적 오류", f"GUI 실행 중 오류 발생:\n{e}\n프로그램을 종료합니다.")
-            except tk.TclError: 
+            except Exception:  # tkinter 미로드/미동작 시 콘솔 출력만 유지
                 pass
 
 if __name__ == "__main__":